@@ -1,12 +1,44 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import heapq
+from collections import deque
+from typing import List, Optional, Sequence
 
 from .models import Process, ProcessMetrics, ScheduleResult, ScheduledSlice
 from .metrics import compute_system_metrics
 
 
-def schedule_fcfs(processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+def _collect_metrics(
+    processes: Sequence[Process],
+    dispatch_order: List[int],
+    start: List[int],
+    completion: List[int],
+) -> List[ProcessMetrics]:
+    """
+    Build per-process metrics, in first-dispatch order, for the preemptive
+    schedulers that track start/completion times by process index.
+    """
+    metrics: List[ProcessMetrics] = []
+    for i in dispatch_order:
+        p = processes[i]
+        turnaround_time = completion[i] - p.arrival_time
+        metrics.append(
+            ProcessMetrics(
+                pid=p.pid,
+                arrival_time=p.arrival_time,
+                burst_time=p.burst_time,
+                start_time=start[i],
+                completion_time=completion[i],
+                waiting_time=turnaround_time - p.burst_time,  # total wait across all slices
+                turnaround_time=turnaround_time,
+                response_time=start[i] - p.arrival_time,
+                priority=p.priority,
+            )
+        )
+    return metrics
+
+
+def schedule_fcfs(processes: Sequence[Process], quantum: Optional[int] = None) -> ScheduleResult:
     """
     First-Come First-Serve (non-preemptive) scheduling.
     """
@@ -16,74 +48,74 @@ def schedule_fcfs(processes: List[Process], quantum: Optional[int] = None) -> Sc
     timeline: List[ScheduledSlice] = []
     metrics: List[ProcessMetrics] = []
 
+    # Each start time is max(arrival, previous completion); everything else
+    # is derived from it in the same pass.
     for p in processes_sorted:
-        if time < p.arrival_time:
-            time = p.arrival_time
-
-        start_time = time
-        end_time = start_time + p.burst_time
-
-        timeline.append(ScheduledSlice(pid=p.pid, start_time=start_time, end_time=end_time))
-
-        completion_time = end_time
-        turnaround_time = completion_time - p.arrival_time
-        waiting_time = start_time - p.arrival_time
-        response_time = waiting_time  # first response equals waiting in FCFS
+        arrival_time = p.arrival_time
+        start_time = time if time > arrival_time else arrival_time
+        time = start_time + p.burst_time
+        waiting_time = start_time - arrival_time
 
+        timeline.append(ScheduledSlice(pid=p.pid, start_time=start_time, end_time=time))
         metrics.append(
             ProcessMetrics(
                 pid=p.pid,
-                arrival_time=p.arrival_time,
+                arrival_time=arrival_time,
                 burst_time=p.burst_time,
                 start_time=start_time,
-                completion_time=completion_time,
+                completion_time=time,
                 waiting_time=waiting_time,
-                turnaround_time=turnaround_time,
-                response_time=response_time,
+                turnaround_time=time - arrival_time,
+                response_time=waiting_time,  # first response equals waiting in FCFS
                 priority=p.priority,
             )
         )
 
-        time = end_time
-
     result = ScheduleResult(algorithm="FCFS", quantum=quantum, processes=metrics, timeline=timeline)
     compute_system_metrics(result)
     return result
 
 
-def schedule_sjf(processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+def schedule_sjf(processes: Sequence[Process], quantum: Optional[int] = None) -> ScheduleResult:
     """
     Shortest Job First (non-preemptive).
 
     At each decision point, among processes that have arrived and are not yet
     completed, choose the one with the smallest burst time.
     """
-    # Work on a shallow copy so we don't surprise callers.
-    remaining: List[Process] = list(processes)
+    # Parallel columns indexed by position in `processes`; the input list
+    # itself is only read, never modified.
+    arrival = [p.arrival_time for p in processes]
+    burst = [p.burst_time for p in processes]
+    arrival_order = sorted(range(len(processes)), key=arrival.__getitem__)
 
     time = 0
     timeline: List[ScheduledSlice] = []
     metrics: List[ProcessMetrics] = []
-    completed_pids: set[str] = set()
+    completed = 0
 
-    while len(completed_pids) < len(remaining):
-        # Ready queue: processes that have arrived and are not completed.
-        ready = [p for p in remaining if p.arrival_time <= time and p.pid not in completed_pids]
+    # Ready queue as a min-heap of (burst, arrival, PID, index) tuples.
+    ready_heap: List[tuple] = []
+    next_idx = 0
 
-        if not ready:
+    while completed < len(processes):
+        # Move processes that have arrived by now into the ready heap.
+        while next_idx < len(arrival_order) and arrival[arrival_order[next_idx]] <= time:
+            i = arrival_order[next_idx]
+            heapq.heappush(ready_heap, (burst[i], arrival[i], processes[i].pid, i))
+            next_idx += 1
+
+        if not ready_heap:
             # If nothing is ready, jump time to the next arrival.
-            next_arrival = min(p.arrival_time for p in remaining if p.pid not in completed_pids)
-            time = next_arrival
+            time = arrival[arrival_order[next_idx]]
             continue
 
         # Choose process with smallest burst time (tie-breaker: earlier arrival, then PID).
-        p = min(
-            ready,
-            key=lambda x: (x.burst_time, x.arrival_time, x.pid),
-        )
+        i = heapq.heappop(ready_heap)[-1]
+        p = processes[i]
 
         start_time = time
-        end_time = start_time + p.burst_time
+        end_time = start_time + burst[i]
 
         timeline.append(ScheduledSlice(pid=p.pid, start_time=start_time, end_time=end_time))
 
@@ -106,7 +138,7 @@ def schedule_sjf(processes: List[Process], quantum: Optional[int] = None) -> Sch
             )
         )
 
-        completed_pids.add(p.pid)
+        completed += 1
         time = end_time
 
     result = ScheduleResult(algorithm="SJF (non-preemptive)", quantum=quantum, processes=metrics, timeline=timeline)
@@ -114,98 +146,92 @@ def schedule_sjf(processes: List[Process], quantum: Optional[int] = None) -> Sch
     return result
 
 
-def schedule_rr(processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+def schedule_rr(processes: Sequence[Process], quantum: Optional[int] = None) -> ScheduleResult:
     """
     Round Robin scheduling with a fixed time quantum.
     """
     if quantum is None or quantum <= 0:
         raise ValueError("Round Robin requires a positive quantum (use --quantum)")
 
-    # Remaining burst time per PID
-    remaining = {p.pid: p.burst_time for p in processes}
-    proc_by_pid = {p.pid: p for p in processes}
+    # Remaining burst time per process index
+    remaining = [p.burst_time for p in processes]
 
     time = 0
     timeline: List[ScheduledSlice] = []
-    metrics_map: dict[str, ProcessMetrics] = {}
-
-    # Ready queue as list of PIDs
-    ready: List[str] = []
+    # First start (-1 until dispatched) and completion time per process
+    # index, plus the order in which processes first ran; metrics are built
+    # from these at the end.
+    start = [-1] * len(processes)
+    completion = [0] * len(processes)
+    dispatch_order: List[int] = []
+
+    # Ready queue of process indices
+    ready: deque[int] = deque()
+
+    # Processes with work to do, in arrival order. Each one crosses the
+    # arrival cursor exactly once, so no membership checks are needed.
+    arrival = [p.arrival_time for p in processes]
+    arrival_order = sorted((i for i, p in enumerate(processes) if p.burst_time > 0), key=arrival.__getitem__)
+    next_idx = 0
+    unfinished = len(arrival_order)
 
     # Convenience: function to enqueue any newly arrived processes
     def enqueue_new_arrivals(current_time: int) -> None:
-        for p in processes:
-            if p.arrival_time <= current_time and p.pid not in ready and remaining[p.pid] > 0:
-                # Only enqueue if not already present and still has remaining time
-                ready.append(p.pid)
+        nonlocal next_idx
+        while next_idx < len(arrival_order) and arrival[arrival_order[next_idx]] <= current_time:
+            ready.append(arrival_order[next_idx])
+            next_idx += 1
 
     # Initialize with processes that arrive at time 0
     enqueue_new_arrivals(time)
 
-    while any(rt > 0 for rt in remaining.values()):
+    while unfinished > 0:
         if not ready:
-            # Jump to next arrival if CPU is idle
-            future_arrivals = [p.arrival_time for p in processes if remaining[p.pid] > 0 and p.arrival_time > time]
-            if not future_arrivals:
+            # Jump to next arrival if CPU is idle; everything up to now has
+            # been enqueued, so that is the process under the cursor.
+            if next_idx >= len(arrival_order):
                 break
-            time = min(future_arrivals)
+            time = arrival[arrival_order[next_idx]]
             enqueue_new_arrivals(time)
             continue
 
-        pid = ready.pop(0)
-        p = proc_by_pid[pid]
+        i = ready.popleft()
+        p = processes[i]
 
         # If this is the first time the process runs, record its start/response
-        if pid not in metrics_map:
-            start_time = max(time, p.arrival_time)
-            waiting_time = start_time - p.arrival_time
-            metrics_map[pid] = ProcessMetrics(
-                pid=pid,
-                arrival_time=p.arrival_time,
-                burst_time=p.burst_time,
-                start_time=start_time,
-                completion_time=0,  # filled later
-                waiting_time=waiting_time,  # will be updated as total wait
-                turnaround_time=0,  # filled later
-                response_time=waiting_time,
-                priority=p.priority,
-            )
-            if start_time > time:
-                time = start_time
+        if start[i] < 0:
+            start[i] = time
+            dispatch_order.append(i)
 
-        run_time = min(quantum, remaining[pid])
+        run_time = min(quantum, remaining[i])
         slice_start = time
         slice_end = time + run_time
-        timeline.append(ScheduledSlice(pid=pid, start_time=slice_start, end_time=slice_end))
+        timeline.append(ScheduledSlice(pid=p.pid, start_time=slice_start, end_time=slice_end))
 
         time = slice_end
-        remaining[pid] -= run_time
+        remaining[i] -= run_time
 
-        # Enqueue any new arrivals that appeared during this slice
-        enqueue_new_arrivals(time)
+        # Enqueue any new arrivals that appeared during this slice; most
+        # slices end before the next arrival, so skip the call entirely then.
+        if next_idx < len(arrival_order) and arrival[arrival_order[next_idx]] <= time:
+            enqueue_new_arrivals(time)
 
-        if remaining[pid] > 0:
-            # Put the process back at the end of the queue
-            if pid not in ready:
-                ready.append(pid)
+        if remaining[i] > 0:
+            # Put the process back at the end of the queue; it was popped to
+            # run, so it cannot already be queued.
+            ready.append(i)
         else:
-            # Process finished; finalize its metrics
-            m = metrics_map[pid]
-            completion_time = time
-            turnaround_time = completion_time - p.arrival_time
-            # Total waiting = turnaround - burst
-            waiting_time_total = turnaround_time - p.burst_time
-            m.completion_time = completion_time
-            m.turnaround_time = turnaround_time
-            m.waiting_time = waiting_time_total
-
-    metrics = list(metrics_map.values())
+            # Process finished
+            unfinished -= 1
+            completion[i] = time
+
+    metrics = _collect_metrics(processes, dispatch_order, start, completion)
     result = ScheduleResult(algorithm="Round Robin", quantum=quantum, processes=metrics, timeline=timeline)
     compute_system_metrics(result)
     return result
 
 
-def schedule_priority(processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+def schedule_priority(processes: Sequence[Process], quantum: Optional[int] = None) -> ScheduleResult:
     """
     Static Priority scheduling (non-preemptive).
 
@@ -213,34 +239,36 @@ def schedule_priority(processes: List[Process], quantum: Optional[int] = None) -
     processes, choose the one with the smallest priority; break ties
     by earlier arrival time, then PID.
     """
-    remaining: List[Process] = list(processes)
+    arrival = [p.arrival_time for p in processes]
+    burst = [p.burst_time for p in processes]
+    # Treat missing priority as lowest priority.
+    prio = [p.priority if p.priority is not None else float("inf") for p in processes]
+    arrival_order = sorted(range(len(processes)), key=arrival.__getitem__)
 
     time = 0
     timeline: List[ScheduledSlice] = []
     metrics: List[ProcessMetrics] = []
-    completed_pids: set[str] = set()
+    completed = 0
 
-    while len(completed_pids) < len(remaining):
-        ready = [
-            p
-            for p in remaining
-            if p.arrival_time <= time and p.pid not in completed_pids
-        ]
+    # Ready queue as a min-heap of (priority, arrival, PID, index) tuples.
+    ready_heap: List[tuple] = []
+    next_idx = 0
 
-        if not ready:
-            next_arrival = min(p.arrival_time for p in remaining if p.pid not in completed_pids)
-            time = next_arrival
-            continue
+    while completed < len(processes):
+        while next_idx < len(arrival_order) and arrival[arrival_order[next_idx]] <= time:
+            i = arrival_order[next_idx]
+            heapq.heappush(ready_heap, (prio[i], arrival[i], processes[i].pid, i))
+            next_idx += 1
 
-        def priority_key(p: Process):
-            # Treat missing priority as lowest priority.
-            prio = p.priority if p.priority is not None else float("inf")
-            return (prio, p.arrival_time, p.pid)
+        if not ready_heap:
+            time = arrival[arrival_order[next_idx]]
+            continue
 
-        p = min(ready, key=priority_key)
+        i = heapq.heappop(ready_heap)[-1]
+        p = processes[i]
 
         start_time = time
-        end_time = start_time + p.burst_time
+        end_time = start_time + burst[i]
 
         timeline.append(ScheduledSlice(pid=p.pid, start_time=start_time, end_time=end_time))
 
@@ -263,7 +291,7 @@ def schedule_priority(processes: List[Process], quantum: Optional[int] = None) -
             )
         )
 
-        completed_pids.add(p.pid)
+        completed += 1
         time = end_time
 
     result = ScheduleResult(algorithm="Priority (static)", quantum=quantum, processes=metrics, timeline=timeline)
@@ -271,82 +299,95 @@ def schedule_priority(processes: List[Process], quantum: Optional[int] = None) -
     return result
 
 
-def schedule_srtf(processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+def schedule_srtf(processes: Sequence[Process], quantum: Optional[int] = None) -> ScheduleResult:
     """
     Shortest Remaining Time First (preemptive SJF).
     """
-    remaining = {p.pid: p.burst_time for p in processes}
-    proc_by_pid = {p.pid: p for p in processes}
+    arrival = [p.arrival_time for p in processes]
+    burst = [p.burst_time for p in processes]
+    remaining = list(burst)
+    # Only processes with work to do ever become ready, in (arrival, PID)
+    # order. A process's position in this order is its tie-break rank.
+    arrival_order = sorted(
+        (i for i in range(len(processes)) if burst[i] > 0),
+        key=lambda i: (arrival[i], processes[i].pid),
+    )
+    unfinished = len(arrival_order)
 
     time = 0
     timeline: List[ScheduledSlice] = []
-    metrics_map: dict[str, ProcessMetrics] = {}
+    # First start (-1 until dispatched) and completion time per process
+    # index, plus the order in which processes first ran; metrics are built
+    # from these at the end.
+    start = [-1] * len(processes)
+    completion = [0] * len(processes)
+    dispatch_order: List[int] = []
+
+    # Ready queue as a min-heap of (remaining, rank) int pairs, which orders
+    # exactly like (remaining, arrival, PID) without string compares. The
+    # running process's entry is held outside the heap, since it is the only
+    # key that changes; the heap never holds stale entries.
+    ready_heap: List[tuple] = []
+    running: Optional[tuple] = None
+    slice_start = 0
+    next_idx = 0
+
+    while unfinished > 0:
+        while next_idx < len(arrival_order) and arrival[arrival_order[next_idx]] <= time:
+            heapq.heappush(ready_heap, (burst[arrival_order[next_idx]], next_idx))
+            next_idx += 1
 
-    def next_arrival_after(t: int) -> Optional[int]:
-        future = [p.arrival_time for p in processes if p.arrival_time > t and remaining[p.pid] > 0]
-        return min(future) if future else None
-
-    while any(rt > 0 for rt in remaining.values()):
-        ready = [p for p in processes if p.arrival_time <= time and remaining[p.pid] > 0]
-        if not ready:
-            nxt = next_arrival_after(time)
-            if nxt is None:
+        # Choose process with smallest remaining time (tie: earlier arrival, then PID).
+        if running is not None:
+            # Only a new arrival can beat the running process; heappushpop
+            # hands it straight back without touching the heap if none does,
+            # and its slice simply keeps running.
+            previous = running
+            running = heapq.heappushpop(ready_heap, running)
+            if running is not previous:
+                preempted = processes[arrival_order[previous[1]]]
+                timeline.append(ScheduledSlice(pid=preempted.pid, start_time=slice_start, end_time=time))
+                slice_start = time
+        elif ready_heap:
+            running = heapq.heappop(ready_heap)
+            slice_start = time
+        else:
+            if next_idx >= len(arrival_order):
                 break
-            time = nxt
+            time = arrival[arrival_order[next_idx]]
             continue
 
-        # Choose process with smallest remaining time (tie: earlier arrival, then PID).
-        current = min(ready, key=lambda p: (remaining[p.pid], p.arrival_time, p.pid))
-
-        if current.pid not in metrics_map:
-            start_time = max(time, current.arrival_time)
-            response_time = start_time - current.arrival_time
-            metrics_map[current.pid] = ProcessMetrics(
-                pid=current.pid,
-                arrival_time=current.arrival_time,
-                burst_time=current.burst_time,
-                start_time=start_time,
-                completion_time=0,
-                waiting_time=0,  # finalize later
-                turnaround_time=0,
-                response_time=response_time,
-                priority=current.priority,
-            )
-            if start_time > time:
-                time = start_time
+        i = arrival_order[running[1]]
+        current = processes[i]
+
+        if start[i] < 0:
+            start[i] = time
+            dispatch_order.append(i)
 
         # Run until completion or next arrival, whichever comes first.
-        nxt_arrival = next_arrival_after(time)
-        if nxt_arrival is None:
-            run_time = remaining[current.pid]
+        if next_idx >= len(arrival_order):
+            run_time = remaining[i]
         else:
-            run_time = min(remaining[current.pid], nxt_arrival - time)
+            run_time = min(remaining[i], arrival[arrival_order[next_idx]] - time)
 
-        slice_start = time
-        slice_end = time + run_time
-        if run_time > 0:
-            timeline.append(ScheduledSlice(pid=current.pid, start_time=slice_start, end_time=slice_end))
-
-        time = slice_end
-        remaining[current.pid] -= run_time
+        time += run_time
+        remaining[i] -= run_time
 
-        if remaining[current.pid] == 0:
-            completion_time = time
-            turnaround_time = completion_time - current.arrival_time
-            waiting_time = turnaround_time - current.burst_time
-
-            m = metrics_map[current.pid]
-            m.completion_time = completion_time
-            m.turnaround_time = turnaround_time
-            m.waiting_time = waiting_time
+        if remaining[i] > 0:
+            running = (remaining[i], running[1])
+        else:
+            timeline.append(ScheduledSlice(pid=current.pid, start_time=slice_start, end_time=time))
+            running = None
+            unfinished -= 1
+            completion[i] = time
 
-    metrics = list(metrics_map.values())
+    metrics = _collect_metrics(processes, dispatch_order, start, completion)
     result = ScheduleResult(algorithm="SRTF", quantum=quantum, processes=metrics, timeline=timeline)
     compute_system_metrics(result)
     return result
 
 
-def schedule_mlfq(processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+def schedule_mlfq(processes: Sequence[Process], quantum: Optional[int] = None) -> ScheduleResult:
     """
     Multi-Level Feedback Queue with 3 levels and increasing quanta.
 
@@ -359,32 +400,46 @@ def schedule_mlfq(processes: List[Process], quantum: Optional[int] = None) -> Sc
     base_q = quantum if quantum and quantum > 0 else 2
     quanta = [base_q, base_q * 2, base_q * 4]
 
-    remaining = {p.pid: p.burst_time for p in processes}
-    proc_by_pid = {p.pid: p for p in processes}
+    remaining = [p.burst_time for p in processes]
 
-    queues: List[List[str]] = [[], [], []]  # Q0, Q1, Q2
-    metrics_map: dict[str, ProcessMetrics] = {}
+    queues: List[deque[int]] = [deque(), deque(), deque()]  # Q0, Q1, Q2 (process indices)
+    # First start (-1 until dispatched) and completion time per process
+    # index, plus the order in which processes first ran; metrics are built
+    # from these at the end.
+    start = [-1] * len(processes)
+    completion = [0] * len(processes)
+    dispatch_order: List[int] = []
     timeline: List[ScheduledSlice] = []
 
     time = 0
 
+    # New arrivals enter Q0 once, as the arrival cursor passes them.
+    arrival = [p.arrival_time for p in processes]
+    arrival_order = sorted((i for i, p in enumerate(processes) if p.burst_time > 0), key=arrival.__getitem__)
+    next_idx = 0
+    unfinished = len(arrival_order)
+
     def enqueue_new_arrivals(current_time: int) -> None:
-        for p in processes:
-            if p.arrival_time <= current_time and remaining[p.pid] > 0 and p.pid not in queues[0] and p.pid not in queues[1] and p.pid not in queues[2]:
-                queues[0].append(p.pid)
+        nonlocal next_idx
+        while next_idx < len(arrival_order) and arrival[arrival_order[next_idx]] <= current_time:
+            queues[0].append(arrival_order[next_idx])
+            next_idx += 1
 
     def any_ready() -> bool:
         return any(queues)
 
-    def next_arrival_after(t: int) -> Optional[int]:
-        future = [p.arrival_time for p in processes if p.arrival_time > t and remaining[p.pid] > 0]
-        return min(future) if future else None
+    def next_arrival() -> Optional[int]:
+        # Arrivals up to the current time are already queued, so the next one
+        # is whatever sits under the cursor.
+        if next_idx < len(arrival_order):
+            return arrival[arrival_order[next_idx]]
+        return None
 
     enqueue_new_arrivals(time)
 
-    while any(rt > 0 for rt in remaining.values()):
+    while unfinished > 0:
         if not any_ready():
-            nxt = next_arrival_after(time)
+            nxt = next_arrival()
             if nxt is None:
                 break
             time = nxt
@@ -393,52 +448,34 @@ def schedule_mlfq(processes: List[Process], quantum: Optional[int] = None) -> Sc
 
         # Pick highest-priority non-empty queue
         level = 0 if queues[0] else 1 if queues[1] else 2
-        pid = queues[level].pop(0)
-        p = proc_by_pid[pid]
+        i = queues[level].popleft()
+        p = processes[i]
 
         # First response
-        if pid not in metrics_map:
-            start_time = max(time, p.arrival_time)
-            response_time = start_time - p.arrival_time
-            metrics_map[pid] = ProcessMetrics(
-                pid=pid,
-                arrival_time=p.arrival_time,
-                burst_time=p.burst_time,
-                start_time=start_time,
-                completion_time=0,
-                waiting_time=0,  # finalize later
-                turnaround_time=0,
-                response_time=response_time,
-                priority=p.priority,
-            )
-            if start_time > time:
-                time = start_time
+        if start[i] < 0:
+            start[i] = time
+            dispatch_order.append(i)
 
-        run_time = min(quanta[level], remaining[pid])
+        run_time = min(quanta[level], remaining[i])
         slice_start = time
         slice_end = time + run_time
-        timeline.append(ScheduledSlice(pid=pid, start_time=slice_start, end_time=slice_end))
+        timeline.append(ScheduledSlice(pid=p.pid, start_time=slice_start, end_time=slice_end))
 
         time = slice_end
-        remaining[pid] -= run_time
+        remaining[i] -= run_time
 
-        enqueue_new_arrivals(time)
+        if next_idx < len(arrival_order) and arrival[arrival_order[next_idx]] <= time:
+            enqueue_new_arrivals(time)
 
-        if remaining[pid] > 0:
+        if remaining[i] > 0:
             # Demote if not already in lowest queue
             next_level = min(level + 1, 2)
-            queues[next_level].append(pid)
+            queues[next_level].append(i)
         else:
-            completion_time = time
-            turnaround_time = completion_time - p.arrival_time
-            waiting_time = turnaround_time - p.burst_time
+            unfinished -= 1
+            completion[i] = time
 
-            m = metrics_map[pid]
-            m.completion_time = completion_time
-            m.turnaround_time = turnaround_time
-            m.waiting_time = waiting_time
-
-    metrics = list(metrics_map.values())
+    metrics = _collect_metrics(processes, dispatch_order, start, completion)
     result = ScheduleResult(algorithm="MLFQ", quantum=base_q, processes=metrics, timeline=timeline)
     compute_system_metrics(result)
     return result
@@ -454,10 +491,14 @@ ALGORITHMS = {
 }
 
 
-def run_algorithm(name: str, processes: List[Process], quantum: Optional[int] = None) -> ScheduleResult:
+def run_algorithm(name: str, processes: Sequence[Process], quantum: Optional[int] = None) -> ScheduleResult:
     """
-    Dispatch to the requested algorithm. Quantum is currently unused except
-    for round-robin/MLFQ (to be implemented).
+    Dispatch to the requested algorithm. Quantum is only used by
+    round-robin/MLFQ.
+
+    Schedulers treat `processes` as read-only: neither the sequence nor the
+    Process objects are modified, so callers can pass the same list (or a
+    tuple) to several algorithms without copying it.
     """
     name = name.lower()
     if name not in ALGORITHMS:
@@ -2,19 +2,28 @@ from __future__ import annotations
 
 import argparse
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List
-
-from rich import box
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from .algorithms import ALGORITHMS, run_algorithm
 from .gantt import build_rich_gantt
 from .metrics import summarize_process_metrics
-from .models import ScheduleResult
+from .models import Process, ProcessMetrics, ScheduleResult
 from .workload_io import load_workload
 
+# Rich is imported inside the functions that render output, so that
+# importing this module, --help and argument errors do not pay for it.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or greater, got {number}")
+    return number
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -55,6 +64,12 @@ def build_parser() -> argparse.ArgumentParser:
         default=0.3,
         help="Seconds to wait between steps when --step is used (default: 0.3).",
     )
+    run_parser.add_argument(
+        "--max-rows",
+        type=_non_negative_int,
+        default=200,
+        help="Show at most this many per-process rows, split between head and tail (0 = all; default: 200).",
+    )
 
     compare_parser = subparsers.add_parser(
         "compare",
@@ -102,7 +117,29 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _print_result(result: ScheduleResult) -> None:
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _select_rows(processes: List[ProcessMetrics], max_rows: int) -> Tuple[List[ProcessMetrics], int]:
+    """
+    Pick the per-process rows to display and how many were left out.
+
+    Large workloads only show the first max_rows // 2 rows and the remaining
+    rows from the end; the summary tables still cover every process. A
+    max_rows of 0 shows everything.
+    """
+    if not 0 < max_rows < len(processes):
+        return processes, 0
+    head = max_rows // 2
+    hidden = len(processes) - max_rows
+    return processes[:head] + processes[head + hidden :], hidden
+
+
+def _print_result(result: ScheduleResult, max_rows: int = 200) -> None:
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console()
 
     console.print(f"[bold]Algorithm:[/bold] {result.algorithm}")
@@ -130,23 +167,34 @@ def _print_result(result: ScheduleResult) -> None:
         "Priority",
     ]
 
-    proc_table = Table(title="Per-process metrics", box=box.SIMPLE_HEAVY)
+    shown, hidden = _select_rows(result.processes, max_rows)
+
+    title = "Per-process metrics"
+    if hidden:
+        title += f" (showing {max_rows} of {len(result.processes)})"
+    proc_table = Table(title=title, box=box.SIMPLE_HEAVY)
     for h in headers:
         justify = "center" if h in {"PID", "Priority"} else "right"
         proc_table.add_column(h, justify=justify)
 
-    for p in result.processes:
-        proc_table.add_row(
+    rows = [
+        (
             p.pid,
-            str(p.arrival_time),
-            str(p.burst_time),
-            str(p.start_time),
-            str(p.completion_time),
-            str(p.waiting_time),
-            str(p.turnaround_time),
-            str(p.response_time),
-            "" if p.priority is None else str(p.priority),
+            f"{p.arrival_time}",
+            f"{p.burst_time}",
+            f"{p.start_time}",
+            f"{p.completion_time}",
+            f"{p.waiting_time}",
+            f"{p.turnaround_time}",
+            f"{p.response_time}",
+            "" if p.priority is None else f"{p.priority}",
         )
+        for p in shown
+    ]
+    if hidden:
+        rows.insert(max_rows // 2, tuple("…" for _ in headers))
+    for row in rows:
+        proc_table.add_row(*row)
 
     console.print(proc_table)
     console.print()
@@ -168,11 +216,26 @@ def _print_result(result: ScheduleResult) -> None:
         console.print(sys_table)
 
 
+@lru_cache(maxsize=64)
+def _run_cached(alg: str, processes: Tuple[Process, ...], quantum: Optional[int]) -> ScheduleResult:
+    """
+    Memoized run_algorithm for the interactive menu, where the same
+    (algorithm, workload, quantum) combination is often re-run. Process is
+    frozen, so the tuple of processes itself is the cache key and is passed
+    straight to the scheduler. Callers must treat the returned result as
+    read-only.
+    """
+    return run_algorithm(alg, processes, quantum=quantum)
+
+
 def _run_compare(workload_path: Path, quantum: int, console: Console) -> None:
     """
     Run the standard compare set on a workload and print the summary table.
     """
-    processes = load_workload(workload_path)
+    from rich import box
+    from rich.table import Table
+
+    workload = tuple(load_workload(workload_path))
     algorithms = ["fcfs", "sjf", "rr", "priority", "srtf", "mlfq"]
 
     summary_table = Table(title=f"Algorithm comparison: {workload_path}", box=box.SIMPLE_HEAVY)
@@ -184,7 +247,7 @@ def _run_compare(workload_path: Path, quantum: int, console: Console) -> None:
 
     for alg in algorithms:
         q = quantum if alg in {"rr", "mlfq"} else None
-        result = run_algorithm(alg, list(processes), quantum=q)
+        result = _run_cached(alg, workload, q)
         summary = summarize_process_metrics(result.processes)
         summary_table.add_row(
             result.algorithm,
@@ -201,8 +264,10 @@ def _animate_result(result: ScheduleResult, delay: float) -> None:
     """
     Simple time-stepped textual simulation using the computed schedule.
     """
+    from rich.console import Console
+
     console = Console()
-    timeline = sorted(result.timeline, key=lambda s: (s.start_time, s.end_time))
+    timeline = result.timeline  # already in chronological order
     if not timeline:
         console.print("[red]No execution to animate.[/red]")
         return
@@ -211,23 +276,46 @@ def _animate_result(result: ScheduleResult, delay: float) -> None:
     console.print(f"[bold]Simulating {result.algorithm}[/bold] (duration {makespan} time units)")
     console.print("[dim]Press Ctrl+C to skip animation.[/dim]")
 
+    # Slices are sorted and non-overlapping, so a single index walks forward
+    # with t: skip slices that have ended, then the next one is running iff
+    # it has started.
+    idx = 0
     for t in range(makespan + 1):
+        while idx < len(timeline) and timeline[idx].end_time <= t:
+            idx += 1
         running = None
-        for sl in timeline:
-            if sl.start_time <= t < sl.end_time:
-                running = sl.pid
-                break
         bar = ""
-        for sl in timeline:
-            if sl.start_time <= t < sl.end_time:
-                bar = f"[green]{'█' * (t - sl.start_time + 1)}[/green]"
-                break
+        if idx < len(timeline) and timeline[idx].start_time <= t:
+            sl = timeline[idx]
+            running = sl.pid
+            bar = f"[green]{'█' * (t - sl.start_time + 1)}[/green]"
         msg = f"t={t:2d}: " + (running or "[idle]")
         console.print(msg + (" " + bar if bar else ""))
         time.sleep(delay)
 
 
+_EXAMPLES_CACHE: Dict[Path, Tuple[int, List[Path]]] = {}
+
+
+def _list_examples(examples_dir: Path) -> List[Path]:
+    """
+    Sorted JSON workloads in examples_dir. The glob is only redone when the
+    directory's mtime changes, i.e. when files are added, removed or renamed.
+    """
+    try:
+        mtime_ns = examples_dir.stat().st_mtime_ns
+    except OSError:
+        return []
+    cached = _EXAMPLES_CACHE.get(examples_dir)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, sorted(examples_dir.glob("*.json")))
+        _EXAMPLES_CACHE[examples_dir] = cached
+    return cached[1]
+
+
 def _interactive_menu(default_workload: str, default_quantum: int) -> None:
+    from rich.console import Console
+
     console = Console()
     alg_choices = list(ALGORITHMS.keys())
     workload = default_workload
@@ -236,9 +324,7 @@ def _interactive_menu(default_workload: str, default_quantum: int) -> None:
     runway_default = str(examples_dir / "runway_workload.json")
 
     def pick_workload(current: str) -> str:
-        available = []
-        if examples_dir.exists():
-            available = sorted([p for p in examples_dir.glob("*.json")])
+        available = _list_examples(examples_dir)
         console.print("\n[bold]Workload selection:[/bold]")
         for idx, p in enumerate(available, start=1):
             console.print(f"  [yellow]{idx}[/yellow]. [white]{p.name}[/white]")
@@ -255,16 +341,21 @@ def _interactive_menu(default_workload: str, default_quantum: int) -> None:
         path_in = input("Enter workload path: ").strip()
         return path_in or current
 
+    compare_current_idx = len(alg_choices) + 1
+    compare_runway_idx = len(alg_choices) + 2
+    # Everything below the current workload line is the same on every loop.
+    menu_lines = ["[bold]Select algorithm by number:[/bold]"]
+    menu_lines += [f"  [yellow]{idx}[/yellow]. [white]{alg}[/white]" for idx, alg in enumerate(alg_choices, start=1)]
+    menu_lines.append(f"  [yellow]{compare_current_idx}[/yellow]. [white]Compare (current workload)[/white]")
+    menu_lines.append(f"  [yellow]{compare_runway_idx}[/yellow]. [white]Compare (runway workload)[/white]")
+    menu_text = "\n".join(menu_lines)
+
     while True:
-        console.print("\n[bold cyan]Scheduler CLI Menu[/bold cyan] [dim](q to quit)[/dim]")
-        console.print(f"[bold]Current workload:[/bold] [green]{workload}[/green]")
-        console.print("[bold]Select algorithm by number:[/bold]")
-        for idx, alg in enumerate(alg_choices, start=1):
-            console.print(f"  [yellow]{idx}[/yellow]. [white]{alg}[/white]")
-        compare_current_idx = len(alg_choices) + 1
-        compare_runway_idx = len(alg_choices) + 2
-        console.print(f"  [yellow]{compare_current_idx}[/yellow]. [white]Compare (current workload)[/white]")
-        console.print(f"  [yellow]{compare_runway_idx}[/yellow]. [white]Compare (runway workload)[/white]")
+        console.print(
+            "\n[bold cyan]Scheduler CLI Menu[/bold cyan] [dim](q to quit)[/dim]\n"
+            f"[bold]Current workload:[/bold] [green]{workload}[/green]\n"
+            f"{menu_text}"
+        )
 
         choice = input(f"Choice [1-{compare_runway_idx} or q]: ").strip().lower()
         if choice in {"q", "quit", "exit"}:
@@ -324,7 +415,11 @@ def _interactive_menu(default_workload: str, default_quantum: int) -> None:
         # Quick workload picker (examples or custom).
         change_wl = input("Change workload? [Enter=no, y=yes]: ").strip().lower()
         if change_wl == "y":
-            workload = pick_workload(workload)
+            new_workload = pick_workload(workload)
+            if new_workload != workload:
+                # Results for the old workload are unlikely to be needed again.
+                _run_cached.cache_clear()
+            workload = new_workload
 
         quantum = quantum_default
         if alg in {"rr", "mlfq"}:
@@ -352,8 +447,7 @@ def _interactive_menu(default_workload: str, default_quantum: int) -> None:
             if not wl_path.exists():
                 console.print(f"[red]Workload not found: {workload}[/red]")
                 continue
-            processes = load_workload(wl_path)
-            result = run_algorithm(alg, processes, quantum=quantum)
+            result = _run_cached(alg, tuple(load_workload(wl_path)), quantum)
              # optional step-by-step animation before summary
             if animate:
                 try:
@@ -368,9 +462,16 @@ def _interactive_menu(default_workload: str, default_quantum: int) -> None:
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    # Parsing does not modify the parser, so it is built once and reused
+    # across calls (e.g. by test or benchmark harnesses driving main()).
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    parser = _PARSER
     args = parser.parse_args(argv)
 
+    from rich.console import Console
+
     console = Console()
 
     if args.command == "run":
@@ -382,10 +483,13 @@ def main(argv: list[str] | None = None) -> int:
                 _animate_result(result, delay=args.step_delay)
             except KeyboardInterrupt:
                 console.print("[yellow]Animation skipped.[/yellow]")
-        _print_result(result)
+        _print_result(result, max_rows=args.max_rows)
         return 0
 
     if args.command == "compare":
+        from rich import box
+        from rich.table import Table
+
         workload_path = Path(args.workload)
         processes = load_workload(workload_path)
 
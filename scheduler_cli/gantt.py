@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from typing import Dict, List
-
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from typing import TYPE_CHECKING, Dict, List
 
 from .models import ScheduledSlice
 
+if TYPE_CHECKING:
+    from rich.panel import Panel
+
 
 def render_gantt(slices: List[ScheduledSlice]) -> str:
     """
@@ -18,34 +17,35 @@ def render_gantt(slices: List[ScheduledSlice]) -> str:
 
     slices = sorted(slices, key=lambda s: (s.start_time, s.end_time))
 
-    line = "|"
-    labels = ""
-    time_marks = "0"
+    # Collect pieces and join once at the end; repeated += on strings is
+    # quadratic in the chart width.
+    line = ["|"]
+    labels: List[str] = []
+    time_marks = ["0"]
     last_time = 0
 
     for sl in slices:
         idle_gap = sl.start_time - last_time
         if idle_gap > 0:
-            line += "." * idle_gap
-            labels += " " * idle_gap
+            line.append("." * idle_gap)
+            labels.append(" " * idle_gap)
             last_time = sl.start_time
-            time_marks += f"{last_time:>3}"
+            time_marks.append(f"{last_time:>3}")
 
         width = max(1, sl.end_time - sl.start_time)
-        line += "=" * width
-        label = sl.pid[: width].ljust(width)
-        labels += label
+        line.append("=" * width)
+        labels.append(sl.pid[: width].ljust(width))
         last_time = sl.end_time
-        time_marks += f"{last_time:>3}"
+        time_marks.append(f"{last_time:>3}")
 
-    line += "|"
+    line.append("|")
 
     return "\n".join(
         [
             "Gantt Chart:",
-            line,
-            labels,
-            time_marks,
+            "".join(line),
+            "".join(labels),
+            "".join(time_marks),
         ]
     )
 
@@ -53,25 +53,28 @@ def render_gantt(slices: List[ScheduledSlice]) -> str:
 def build_rich_gantt(slices: List[ScheduledSlice]) -> tuple[Panel, str]:
     """
     Build a Rich Panel containing a colored Gantt chart and a string with time marks.
+
+    Slices must already be in chronological order, as in ScheduleResult.timeline.
     """
+    # Rich is imported lazily so that importing this module (e.g. for
+    # render_gantt) stays cheap.
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
     if not slices:
         panel = Panel("No execution", title="Gantt Chart")
         return panel, ""
 
-    slices = sorted(slices, key=lambda s: (s.start_time, s.end_time))
-
     colors = ["red", "green", "yellow", "blue", "magenta", "cyan"]
-    pid_to_color: Dict[str, str] = {}
-
-    def pid_color(pid: str) -> str:
-        if pid not in pid_to_color:
-            idx = len(pid_to_color) % len(colors)
-            pid_to_color[pid] = colors[idx]
-        return pid_to_color[pid]
+    # Colors are assigned to PIDs in order of first appearance, up front, so
+    # the render loop is a plain dict lookup per slice.
+    unique_pids = dict.fromkeys(sl.pid for sl in slices)
+    pid_to_color: Dict[str, str] = {pid: colors[idx % len(colors)] for idx, pid in enumerate(unique_pids)}
 
     timeline = Text()
     labels = Text()
-    time_marks = "0"
+    time_marks = ["0"]
     last_time = 0
 
     for sl in slices:
@@ -80,21 +83,21 @@ def build_rich_gantt(slices: List[ScheduledSlice]) -> tuple[Panel, str]:
             timeline.append(" " * idle_gap)
             labels.append(" " * idle_gap)
             last_time = sl.start_time
-            time_marks += f"{last_time:>3}"
+            time_marks.append(f"{last_time:>3}")
 
         width = max(1, sl.end_time - sl.start_time)
-        color = pid_color(sl.pid)
+        color = pid_to_color[sl.pid]
 
         timeline.append(" " * width, style=f"on {color}")
         labels.append(sl.pid[: width].ljust(width), style="bold")
 
         last_time = sl.end_time
-        time_marks += f"{last_time:>3}"
+        time_marks.append(f"{last_time:>3}")
 
     table = Table.grid(padding=(0, 0))
     table.add_row(timeline)
     table.add_row(labels)
 
     panel = Panel.fit(table, title="Gantt Chart")
-    return panel, time_marks
+    return panel, "".join(time_marks)
 
@@ -13,16 +13,26 @@ def compute_system_metrics(result: ScheduleResult) -> SystemMetrics:
     if not result.processes:
         return SystemMetrics(cpu_busy_time=0, makespan=0, throughput=0.0, cpu_utilization=0.0)
 
-    makespan = max(p.completion_time for p in result.processes)
-    cpu_busy_time = sum(slice_.end_time - slice_.start_time for slice_ in result.timeline)
+    # The last slice to end is the last completion, so busy time and makespan
+    # both come from one pass over the timeline.
+    cpu_busy_time = 0
+    makespan = 0
+    for slice_ in result.timeline:
+        cpu_busy_time += slice_.end_time - slice_.start_time
+        if slice_.end_time > makespan:
+            makespan = slice_.end_time
+
+    waits: List[int] = [p.waiting_time for p in result.processes]
+    wait_sum = sum(waits)
 
     throughput = len(result.processes) / makespan if makespan > 0 else 0.0
     cpu_utilization = cpu_busy_time / makespan if makespan > 0 else 0.0
 
     # Starvation detection is algorithm-specific; for now, count processes whose
     # waiting time is more than 2x the average waiting time.
-    avg_wait = sum(p.waiting_time for p in result.processes) / len(result.processes)
-    starvation_count = sum(1 for p in result.processes if p.waiting_time > 2 * avg_wait)
+    avg_wait = wait_sum / len(result.processes)
+    starvation_threshold = 2 * avg_wait
+    starvation_count = sum(1 for w in waits if w > starvation_threshold)
 
     system = SystemMetrics(
         cpu_busy_time=cpu_busy_time,
@@ -42,11 +52,18 @@ def summarize_process_metrics(processes: List[ProcessMetrics]) -> dict:
     if not processes:
         return {"avg_waiting": 0.0, "avg_turnaround": 0.0, "avg_response": 0.0}
 
+    # One pass accumulating all three totals.
+    wait_sum = turnaround_sum = response_sum = 0
+    for p in processes:
+        wait_sum += p.waiting_time
+        turnaround_sum += p.turnaround_time
+        response_sum += p.response_time
+
     n = len(processes)
     return {
-        "avg_waiting": sum(p.waiting_time for p in processes) / n,
-        "avg_turnaround": sum(p.turnaround_time for p in processes) / n,
-        "avg_response": sum(p.response_time for p in processes) / n,
+        "avg_waiting": wait_sum / n,
+        "avg_turnaround": turnaround_sum / n,
+        "avg_response": response_sum / n,
     }
 
 
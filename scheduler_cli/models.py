@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, NamedTuple, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Process:
     pid: str
     arrival_time: int
@@ -12,10 +12,12 @@ class Process:
     priority: Optional[int] = None
 
 
-@dataclass
-class ScheduledSlice:
+class ScheduledSlice(NamedTuple):
     """
     One contiguous slice of execution for a process in the Gantt chart.
+
+    A plain tuple underneath: schedulers emit many of these, and sorting by
+    (start_time, end_time) compares native tuple fields.
     """
 
     pid: str
@@ -23,7 +25,7 @@ class ScheduledSlice:
     end_time: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessMetrics:
     pid: str
     arrival_time: int
@@ -36,7 +38,7 @@ class ProcessMetrics:
     priority: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     cpu_busy_time: int
     makespan: int
@@ -45,8 +47,13 @@ class SystemMetrics:
     starvation_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleResult:
+    """
+    Output of a scheduler run. Schedulers append timeline slices as they
+    execute, so the timeline is always in chronological order.
+    """
+
     algorithm: str
     quantum: Optional[int]
     processes: List[ProcessMetrics] = field(default_factory=list)
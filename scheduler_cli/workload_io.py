@@ -2,37 +2,74 @@ from __future__ import annotations
 
 import csv
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 
 from .models import Process
 
+try:
+    # Optional faster JSON parser; the stdlib parser is used when it is absent.
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def load_workload(path: str | Path) -> List[Process]:
     """
     Load a workload from a JSON or CSV file into a list of Process objects.
+
+    Parsed workloads are cached per file, keyed on its modification time and
+    size, so reloading an unchanged file skips parsing. Each call returns a
+    fresh list; the (frozen) Process objects in it are shared between calls.
     """
     path = Path(path)
     suffix = path.suffix.lower()
 
-    if suffix == ".json":
-        return _load_json(path)
-    if suffix == ".csv":
-        return _load_csv(path)
+    if suffix not in {".json", ".csv"}:
+        raise ValueError(f"Unsupported workload format: {suffix} (use .json or .csv)")
+
+    stat = path.stat()
+    return list(_load_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size))
 
-    raise ValueError(f"Unsupported workload format: {suffix} (use .json or .csv)")
+
+@lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Process, ...]:
+    # mtime_ns and size are only part of the cache key; an edited file gets a
+    # new key and is parsed again.
+    path = Path(path_str)
+    if path.suffix.lower() == ".json":
+        return tuple(_load_json(path))
+    return tuple(_load_csv(path))
 
 
 def _load_json(path: Path) -> List[Process]:
-    with path.open("r", encoding="utf-8") as f:
-        raw = json.load(f)
+    # Parse the whole file from bytes in one call rather than through a text
+    # wrapper; both parsers accept UTF-8 bytes directly.
+    raw = _json_loads(path.read_bytes())
 
     if not isinstance(raw, Iterable):
         raise ValueError("JSON workload must be a list of process objects")
 
+    # The try is set up once around the whole batch; on failure the index of
+    # the offending entry is reported.
     processes: List[Process] = []
-    for entry in raw:
-        processes.append(_process_from_mapping(entry))
+    idx, entry = 0, None
+    try:
+        for idx, entry in enumerate(raw):
+            priority_val = entry.get("priority")
+            processes.append(
+                Process(
+                    pid=str(entry["pid"]),
+                    arrival_time=int(entry["arrival_time"]),
+                    burst_time=int(entry["burst_time"]),
+                    priority=int(priority_val) if priority_val not in (None, "") else None,
+                )
+            )
+    except (AttributeError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid process entry at index {idx}: {entry!r}") from exc
 
     return processes
 
@@ -40,28 +77,37 @@ def _load_json(path: Path) -> List[Process]:
 def _load_csv(path: Path) -> List[Process]:
     processes: List[Process] = []
     with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            processes.append(_process_from_mapping(row))
+        # Plain csv.reader with column positions resolved once from the
+        # header, instead of a dict per row from DictReader.
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return processes
+
+        try:
+            pid_idx = header.index("pid")
+            arrival_idx = header.index("arrival_time")
+            burst_idx = header.index("burst_time")
+        except ValueError as exc:
+            raise ValueError(f"CSV workload header must include pid, arrival_time and burst_time: {header!r}") from exc
+        priority_idx = header.index("priority") if "priority" in header else -1
+
+        row: List[str] = []
+        try:
+            for row in reader:
+                if not row:
+                    continue
+                priority_val = row[priority_idx] if 0 <= priority_idx < len(row) else ""
+                processes.append(
+                    Process(
+                        pid=row[pid_idx],
+                        arrival_time=int(row[arrival_idx]),
+                        burst_time=int(row[burst_idx]),
+                        priority=int(priority_val) if priority_val != "" else None,
+                    )
+                )
+        except (IndexError, ValueError) as exc:
+            raise ValueError(
+                f"Invalid process entry on line {reader.line_num}: {dict(zip(header, row))!r}"
+            ) from exc
     return processes
-
-
-def _process_from_mapping(mapping) -> Process:
-    try:
-        pid = str(mapping["pid"])
-        arrival_time = int(mapping["arrival_time"])
-        burst_time = int(mapping["burst_time"])
-    except (KeyError, TypeError, ValueError) as exc:
-        raise ValueError(f"Invalid process entry: {mapping!r}") from exc
-
-    priority_val = mapping.get("priority")
-    priority = int(priority_val) if priority_val not in (None, "") else None
-
-    return Process(
-        pid=pid,
-        arrival_time=arrival_time,
-        burst_time=burst_time,
-        priority=priority,
-    )
-
-
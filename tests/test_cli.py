@@ -0,0 +1,32 @@
+import pytest
+
+from scheduler_cli.cli import _select_rows, build_parser
+from scheduler_cli.models import ProcessMetrics
+
+
+def _metrics(n):
+    return [ProcessMetrics(f"P{i}", i, 1, i, i + 1, 0, 1, 0) for i in range(n)]
+
+
+def test_select_rows_keeps_head_and_tail():
+    shown, hidden = _select_rows(_metrics(10), 3)
+    # Odd limits give the extra row to the tail.
+    assert [p.pid for p in shown] == ["P0", "P8", "P9"]
+    assert hidden == 7
+
+
+def test_select_rows_single_row_shows_last():
+    shown, hidden = _select_rows(_metrics(5), 1)
+    assert [p.pid for p in shown] == ["P4"]
+    assert hidden == 4
+
+
+def test_select_rows_zero_or_large_limit_shows_all():
+    procs = _metrics(4)
+    assert _select_rows(procs, 0) == (procs, 0)
+    assert _select_rows(procs, 4) == (procs, 0)
+
+
+def test_max_rows_rejects_negative():
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["run", "-a", "fcfs", "-w", "w.json", "--max-rows", "-1"])
@@ -1,4 +1,6 @@
 from scheduler_cli.algorithms import (
+    ALGORITHMS,
+    run_algorithm,
     schedule_fcfs,
     schedule_sjf,
     schedule_rr,
@@ -57,3 +59,34 @@ def test_mlfq_completes():
     assert res.system.cpu_busy_time == sum(p.burst_time for p in _procs())
 
 
+def test_rr_new_arrival_runs_before_preempted():
+    res = schedule_rr([Process("A", 0, 5), Process("B", 1, 3)], quantum=2)
+    # B arrives during A's first slice, so it is queued ahead of the preempted A.
+    assert [s.pid for s in res.timeline] == ["A", "B", "A", "B", "A"]
+
+
+def test_mlfq_demoted_process_not_requeued_at_top():
+    res = schedule_mlfq([Process("A", 0, 5), Process("B", 0, 3)], quantum=2)
+    assert [(s.pid, s.start_time, s.end_time) for s in res.timeline] == [
+        ("A", 0, 2),
+        ("B", 2, 4),
+        ("A", 4, 7),
+        ("B", 7, 8),
+    ]
+
+
+def test_srtf_keeps_slice_when_arrival_does_not_preempt():
+    res = schedule_srtf([Process("A", 0, 5), Process("B", 1, 8), Process("C", 2, 1)])
+    assert [(s.pid, s.start_time, s.end_time) for s in res.timeline] == [
+        ("A", 0, 2),
+        ("C", 2, 3),
+        ("A", 3, 6),
+        ("B", 6, 14),
+    ]
+
+
+def test_schedulers_leave_input_untouched():
+    procs = tuple(_procs())
+    for name in ALGORITHMS:
+        run_algorithm(name, procs, quantum=2)
+    assert list(procs) == _procs()
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from scheduler_cli.workload_io import load_workload
 from scheduler_cli.models import Process
 
@@ -26,3 +28,28 @@ def test_load_csv(tmp_path: Path):
     assert procs[1].priority is None
 
 
+def test_load_csv_reports_bad_row(tmp_path: Path):
+    p = tmp_path / "w.csv"
+    p.write_text("pid,arrival_time,burst_time,priority\nA,0,3,1\nB,soon,2,\n")
+    with pytest.raises(ValueError, match="line 3"):
+        load_workload(p)
+
+
+def test_load_reparses_edited_file(tmp_path: Path):
+    p = tmp_path / "w.csv"
+    p.write_text("pid,arrival_time,burst_time\nA,0,3\n")
+    assert [q.pid for q in load_workload(p)] == ["A"]
+
+    p.write_text("pid,arrival_time,burst_time\nA,0,3\nB,1,2\n")
+    assert [q.pid for q in load_workload(p)] == ["A", "B"]
+
+
+def test_loaded_processes_cannot_leak_edits(tmp_path: Path):
+    p = tmp_path / "w.csv"
+    p.write_text("pid,arrival_time,burst_time\nA,0,3\n")
+    procs = load_workload(p)
+    with pytest.raises(AttributeError):
+        procs[0].burst_time = 99
+    procs.append(Process("B", 1, 2))
+
+    assert load_workload(p) == [Process("A", 0, 3)]